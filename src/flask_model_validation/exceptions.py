@@ -26,7 +26,7 @@ class ValidateError(Exception):
         super().__init__(*args)
 
     def __str__(self) -> str:
-        message = super().__str__() + "\n"
-        for attr, errors in self.errors.items():
-            message += f"{attr}: {errors}"
-        return message
+        return "\n".join(
+            [super().__str__()]
+            + [f"{attr}: {errors}" for attr, errors in self.errors.items()]
+        )
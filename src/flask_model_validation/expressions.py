@@ -8,20 +8,28 @@ from .query import Query
 __all__ = ["or_", "and_", "_"]
 
 
-def conditional_expression(
-    expression: Callable, *args, **kwargs
-) -> Callable[[Query], sqlelements.BinaryExpression]:
+class _Conditional:
     """Logic for conditionals (`or` and `and`)."""
 
-    def _internal_expression(query: Query):
-        if not isinstance(query, Query):
-            raise ValueError("The query object must be a object" "of `CustomQuery`")
-        criterion = query.make_criterion(**kwargs)
-        for subexpression in args:
-            criterion.append(subexpression(query))
-        return expression(*criterion)
+    def __init__(self, expression: Callable, *args, **kwargs):
+        """Init the object.
 
-    return _internal_expression
+        Args:
+            expression: SQLAlchemy conditional (`or_`, `and_`).
+            args: Subexpressions to add into the conditional.
+            kwargs: Dict with key field in model,
+                and value as value to filter in db.
+        """
+        self.expression = expression
+        self.subexpressions = args
+        self.kwargs = kwargs
+
+    def __call__(self, query: Query) -> sqlelements.BinaryExpression:
+        if not isinstance(query, Query):
+            raise ValueError("The query object must be a object of `Query`")
+        criterion = query.make_criterion(**self.kwargs)
+        criterion.extend(subexpression(query) for subexpression in self.subexpressions)
+        return self.expression(*criterion)
 
 
 def or_(*args, **kwargs):
@@ -41,7 +49,7 @@ def or_(*args, **kwargs):
 
         `Model.query.find(or_(_(name='Foo'), _(name='Bar')))`
     """
-    return conditional_expression(sqlalchemy.or_, *args, **kwargs)
+    return _Conditional(sqlalchemy.or_, *args, **kwargs)
 
 
 def and_(*args, **kwargs):
@@ -56,7 +64,7 @@ def and_(*args, **kwargs):
         `Model.query.find(or_(and_(name='foo', age='19'),
                           and_(name='bar', age='25')))`
     """
-    return conditional_expression(sqlalchemy.and_, *args, **kwargs)
+    return _Conditional(sqlalchemy.and_, *args, **kwargs)
 
 
 def _(**kwargs):
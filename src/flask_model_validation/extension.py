@@ -15,6 +15,7 @@ class SQLAlchemyModelValidation(SQLAlchemy):
     """Extending from SQLAlchemy to add new properties."""
 
     instance: Self | None = None
+    _initialized = False
 
     def __init__(
         self,
@@ -24,17 +25,28 @@ class SQLAlchemyModelValidation(SQLAlchemy):
         model_class: type[Model] = Model,
         **kwargs,
     ):
-        """Overriding the `query_class` by default."""
+        """Overriding the `query_class` by default.
+
+        The instance is a singleton, so it is only initialized the first
+        time it is created.
+        """
+        if self._initialized:
+            return
         super().__init__(
             app, query_class=query_class, model_class=model_class, **kwargs
         )
+        self.ValidateColumn = ValidateColumn
+        self._initialized = True
 
     def __getattr__(self, name: str) -> Any:
-        if name == "ValidateColumn":
-            return ValidateColumn
-        return super().__getattr__(name)
-
-    def __new__(cls):
+        value = super().__getattr__(name)
+        # Saved in the instance, so the next access doesn't resolve it again.
+        # `db` is excluded to keep its deprecation warning.
+        if name != "db":
+            setattr(self, name, value)
+        return value
+
+    def __new__(cls, *args, **kwargs):
         """Applying singleton for this class."""
         if cls.instance is None:
             cls.instance = super().__new__(cls)
@@ -43,8 +55,9 @@ class SQLAlchemyModelValidation(SQLAlchemy):
 
 def db() -> SQLAlchemyModelValidation:
     """Get the singleton for SQLAlchemyModelValidation."""
-    if SQLAlchemyModelValidation.instance:
-        return SQLAlchemyModelValidation.instance
-    raise NotImplementedError(
-        "The db through `SQLAlchemyValidation hasn't` been created"
-    )
+    instance = SQLAlchemyModelValidation.instance
+    if instance is None:
+        raise NotImplementedError(
+            "The db through `SQLAlchemyModelValidation` hasn't been created"
+        )
+    return instance
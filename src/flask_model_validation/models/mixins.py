@@ -1,14 +1,14 @@
-from datetime import datetime
+import functools
 from typing import Any
 
 import sqlalchemy as sa
-import slugify
+from sqlalchemy.ext.compiler import compiles
 
 from ..validation import ValidateColumn
 from ..models import Model
-from .. import extension as ex
 
 __all__ = [
+    "UtcNow",
     "IdMixin",
     "TimestampMixin",
     "SlugMixin",
@@ -17,6 +17,66 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(maxsize=4096)
+def _slugify(value: str) -> str:
+    """Slugify the value, cached because values repeat in bulk inserts."""
+    # Imported here to not load it in apps that don't use `SlugMixin`.
+    from slugify import slugify
+
+    return slugify(value)
+
+
+class UtcNow(sa.sql.expression.FunctionElement):
+    """Current UTC timestamp in the database, as `datetime.utcnow` in Python.
+
+    `CURRENT_TIMESTAMP` is UTC in SQLite but the session time zone in
+    other databases, so PostgreSQL, MySQL, MariaDB, SQL Server and Oracle
+    use their own UTC function. Other dialects use `CURRENT_TIMESTAMP`.
+    """
+
+    type = sa.DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _utcnow_default(element: UtcNow, compiler: Any, **kwargs) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcNow, "postgresql")
+def _utcnow_postgresql(element: UtcNow, compiler: Any, **kwargs) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(UtcNow, "mysql")
+@compiles(UtcNow, "mariadb")
+def _utcnow_mysql(element: UtcNow, compiler: Any, **kwargs) -> str:
+    # Parentheses allow it as an expression default in the DDL.
+    return "(UTC_TIMESTAMP())"
+
+
+@compiles(UtcNow, "mssql")
+def _utcnow_mssql(element: UtcNow, compiler: Any, **kwargs) -> str:
+    return "GETUTCDATE()"
+
+
+@compiles(UtcNow, "oracle")
+def _utcnow_oracle(element: UtcNow, compiler: Any, **kwargs) -> str:
+    return "SYS_EXTRACT_UTC(SYSTIMESTAMP)"
+
+
+# Key in `session.info` of the slugs of the rows not flushed yet.
+PENDING_SLUGS = "pending_slugs"
+
+
+@sa.event.listens_for(sa.orm.Session, "after_flush")
+@sa.event.listens_for(sa.orm.Session, "after_commit")
+@sa.event.listens_for(sa.orm.Session, "after_rollback")
+def _clear_pending_slugs(session: sa.orm.Session, *args) -> None:
+    """The pending slugs are in database or discarded, so they are removed."""
+    session.info.pop(PENDING_SLUGS, None)
+
+
 class IdMixin:
     """Mixin used to add id.
 
@@ -43,9 +103,9 @@ class TimestampMixin:
     """
 
     created = ValidateColumn(
-        "created_at", sa.DateTime, nullable=False, default=datetime.utcnow
+        "created_at", sa.DateTime, nullable=False, default=UtcNow()
     )
-    updated = ValidateColumn("updated_at", sa.DateTime, onupdate=datetime.utcnow)
+    updated = ValidateColumn("updated_at", sa.DateTime, onupdate=UtcNow())
 
 
 class SlugMixin(Model):
@@ -77,31 +137,120 @@ class SlugMixin(Model):
             self.is_new
             or self.history_change(self.field_to_slugfy).was_changed  # pyright: ignore
         ):
-            self.slug = slugify.slugify(self.field_to_slugfy_value)
+            pending_slugs = self.pending_slugs
+            # The previous slug of this row is free again.
+            if pending_slugs.get(self.slug) is self:
+                del pending_slugs[self.slug]
+            self.slug = _slugify(self.field_to_slugfy_value)
             self.truncate_slug()
-            slug_used = self.query.find(slug=self.slug).first()
-            if slug_used and slug_used.pk != self.pk:
-                additional_data = 1
-                tmp_slug = self.slug
-                while slug_used and slug_used.pk != self.pk:
-                    self.slug = f"{tmp_slug}-{additional_data}"
-                    if (
-                        len(self.slug)
-                        > self.mapper.columns.get("slug").type.length  # pyright: ignore
-                    ):
-                        self.slug = (
-                            str(tmp_slug[: -(len(str(additional_data)) + 1)])
-                            + "-"
-                            + str(additional_data)
-                        )
-                    slug_used = self.query.find(slug=self.slug).first()
-                    additional_data += 1
+            # Usually the slug is free, which only needs an EXISTS query.
+            if self.slug_is_used(self.slug):
+                self.slug = self.free_slug(self.slug)
+            pending_slugs[self.slug] = self
+
+    def free_slug(self, tmp_slug: str) -> str:
+        """Search a free slug adding a number to the used one.
+
+        All the slugs that could collide are fetched in one query and
+        the free one is searched in memory.
+
+        Args:
+            tmp_slug: The slug that is already used.
+        Returns:
+            The first slug with a number that is not used.
+        """
+        slug_column = self.mapper.columns.get("slug")
+        allowed_length = slug_column.type.length  # pyright: ignore
+        slug = tmp_slug
+        prefix = tmp_slug
+        used_slugs = self.used_slugs(prefix)
+        additional_data = 0
+        while slug in used_slugs:
+            additional_data += 1
+            slug = f"{tmp_slug}-{additional_data}"
+            if len(slug) > allowed_length:
+                slug = (
+                    str(tmp_slug[: -(len(str(additional_data)) + 1)])
+                    + "-"
+                    + str(additional_data)
+                )
+            # The slug was truncated more, so the used slugs are
+            # fetched again with the shorter prefix.
+            if not slug.startswith(prefix):
+                prefix = slug.rpartition("-")[0]
+                used_slugs = self.used_slugs(prefix)
+        return slug
+
+    @property
+    def pending_slugs(self) -> dict[str, Any]:
+        """Slugs generated in the session for the class, with the row that uses it.
+
+        They are cleared when the session is flushed, committed or
+        rolled back, see `_clear_pending_slugs`.
+        """
+        session_slugs = self.db.session.info.setdefault(PENDING_SLUGS, {})
+        return session_slugs.setdefault(self.__class__, {})
+
+    def is_pending_slug(self, slug: str) -> bool:
+        """If the slug is used by other row that is not flushed yet.
+
+        Args:
+            slug: The slug to search.
+        Returns:
+            If the slug was generated for other pending row in the session.
+        """
+        row = self.pending_slugs.get(slug)
+        return row is not None and row is not self and sa.inspect(row).pending
+
+    def other_slugs_query(self) -> Any:
+        """Query of the slugs that belong to other rows."""
+        query = self.query.with_entities(self.__class__.slug)
+        if not self.is_new:
+            query = query.filter(self.mapper.primary_key[0] != self.pk)
+        return query
+
+    def slug_is_used(self, slug: str) -> bool:
+        """If the slug is used by other row, in database or pending to flush.
+
+        Args:
+            slug: The slug to search.
+        Returns:
+            If the slug already exists in database.
+        """
+        if self.is_pending_slug(slug):
+            return True
+        query = self.other_slugs_query().filter(self.__class__.slug == slug)
+        return bool(self.db.session.query(query.exists()).scalar())
+
+    def used_slugs(self, prefix: str) -> set[str]:
+        """Slugs used by other rows, in database or pending, that begin with `prefix`.
+
+        Args:
+            prefix: The beginning of the slugs to search.
+        Returns:
+            A set with the slugs already used in database.
+        """
+        query = self.other_slugs_query().filter(self.__class__.slug.like(f"{prefix}%"))
+        used_slugs = {slug for slug, in query.all()}
+        used_slugs.update(
+            slug
+            for slug in self.pending_slugs
+            if slug.startswith(prefix) and self.is_pending_slug(slug)
+        )
+        return used_slugs
 
     def truncate_slug(self) -> None:
         """Make the slug according the length of the db length."""
         allowed_length = self.mapper.columns.get("slug").type.length  # pyright: ignore
-        while len(self.slug) > allowed_length:  # pyright: ignore
-            self.slug = "-".join(self.slug.split("-")[:-1])
+        slug = self.slug
+        while len(slug) > allowed_length:  # pyright: ignore
+            index = slug.rfind("-")
+            # There are no more words to remove, so the slug is cut.
+            if index < 0:
+                slug = slug[:allowed_length]
+                break
+            slug = slug[:index]
+        self.slug = slug
 
 
 class CatalogModelMixin(IdMixin, SlugMixin, TimestampMixin):
@@ -159,6 +308,7 @@ class DefineCatalogMixin(CatalogModelMixin):
             """Pass the parent to allow use query inside the catalog."""
             self.model = model
             self.cache = {}
+            self.prefetched = False
 
         def __getattr__(self, attr):
             """Get attr magic method."""
@@ -168,18 +318,68 @@ class DefineCatalogMixin(CatalogModelMixin):
                 raise AttributeError(f"{key} does not exist in the catalog")
             return self.get_element(key)
 
+        @property
+        def query(self) -> Any:
+            """Query of the model of the catalog."""
+            query = getattr(self.model, "query", None)
+            if not query:
+                raise NotImplementedError("The class must extend from db.Model")
+            return query
+
+        def load(self, criterion: Any) -> list[Any]:
+            """Get the elements with the session of the model query.
+
+            The rows flushed in the current transaction are found, and
+            the elements that were not in the session before are expunged,
+            so the rows already in the session keep their changes.
+
+            Args:
+                criterion: Condition of the elements to get.
+            Returns:
+                The elements found.
+            """
+            query = self.query
+            session = query.session
+            identity_keys = set(session.identity_map.keys())
+            elements = query.filter(criterion).all()
+            for element in elements:
+                if sa.inspect(element).identity_key not in identity_keys:
+                    session.expunge(element)
+            return elements
+
+        def prefetch(self) -> None:
+            """Get all the elements defined in the catalog with one query."""
+            catalog_class = getattr(self.model, self.model.catalog_class_name)
+            catalog_map = {
+                attr: value
+                for attr, value in vars(catalog_class).items()
+                if not attr.startswith("_")
+            }
+            field = getattr(self.model, self.model.catalog_field)
+            for element in self.load(field.in_(catalog_map.values())):
+                self.cache[getattr(element, self.model.catalog_field)] = element
+            # Assigned to the object, so they are got without `__getattr__`.
+            for attr, key in catalog_map.items():
+                if (
+                    key in self.cache
+                    and attr not in vars(self)
+                    and not hasattr(type(self), attr)
+                ):
+                    setattr(self, attr, self.cache[key])
+            self.prefetched = True
+
         def get_element(self, key: str) -> Any:
             """Get element from the database."""
+            if not self.prefetched:
+                self.prefetch()
             if key in self.cache:
                 return self.cache[key]
-            query = getattr(self.model, "query", None)
-            if not query:
-                raise NotImplementedError("The class must extend from db.Model")
-            element = query.find(**{self.model.catalog_field: key}).first()
-            if not element:
+            # The element could be added after the prefetch.
+            field = getattr(self.model, self.model.catalog_field)
+            elements = self.load(field == key)
+            if not elements:
                 raise AttributeError(f"Element with key {key} does not exist.")
-            ex.db().session.expunge(element)
-            self.cache[key] = element
+            element = self.cache[key] = elements[0]
             return element
 
         def key(self, key: str):
@@ -1,6 +1,7 @@
+from collections import Counter
 from typing import Any
 
-from sqlalchemy import inspect, orm
+from sqlalchemy import Column, inspect, orm, update
 from sqlalchemy.orm.mapper import Mapper
 from flask_sqlalchemy import model
 
@@ -49,19 +50,18 @@ class Model(model.Model):
     """
 
     many_to_many_key_relation = "has"
+    # Unique values searched by `validate_many`, with if they are used.
+    _unique_values: dict[str, dict[Any, bool]] | None = None
 
     @property
     def db(self) -> Any:
         """Gets the db from the SQLAlchemyModelValidation singleton."""
-        return fmv.db().instance
+        return fmv.db()
 
     @property
     def pk(self) -> Any:
         """Returns the value of the primary key field."""
-        primary_key_key = self.mapper.primary_key[0].key
-        for col in self.mapper.column_attrs:
-            if col.columns[0].key == primary_key_key:
-                return getattr(self, col.key)
+        return getattr(self, self.__class__.get_pk_attr())
 
     @pk.setter
     def pk(self, value) -> None:
@@ -84,10 +84,49 @@ class Model(model.Model):
     @property
     def mapper(self) -> Mapper:
         """Gets the current mapper from sqlalchemy inspector."""
-        mapper = inspect(self.__class__)
-        if not mapper:
-            raise Exception("Mapper it was not itialized")
-        return mapper
+        return self.__class__.get_mapper()
+
+    @classmethod
+    def get_mapper(cls) -> Mapper:
+        """Gets the mapper of the class, it is only inspected the first time."""
+        if "_mapper" not in cls.__dict__:
+            mapper = inspect(cls)
+            if not mapper:
+                raise Exception("Mapper it was not itialized")
+            cls._mapper = mapper
+        return cls._mapper
+
+    @classmethod
+    def get_pk_attr(cls) -> str:
+        """Gets the attribute name of the primary key, it is only searched once."""
+        if "_pk_attr" not in cls.__dict__:
+            mapper = cls.get_mapper()
+            cls._pk_attr = mapper.get_property_by_column(mapper.primary_key[0]).key
+        return cls._pk_attr
+
+    @classmethod
+    def get_validate_plan(
+        cls, fields: list[str] | None = None
+    ) -> list[tuple[str, Column]]:
+        """Gets the columns to validate, it is only built the first time.
+
+        Args:
+            fields: fields that should be validated.
+                If it is None, it will return all the columns to validate.
+        Returns:
+            A list of tuples with the field key and its `ValidateColumn`.
+        """
+        if "_validate_plans" not in cls.__dict__:
+            cls._validate_plans = {}
+        plan_key = frozenset(fields) if fields else None
+        if plan_key not in cls._validate_plans:
+            cls._validate_plans[plan_key] = [
+                (key, col)
+                for key, col in cls.get_mapper().columns.items()
+                if isinstance(col, fmv.ValidateColumn)
+                and (plan_key is None or key in plan_key)
+            ]
+        return cls._validate_plans[plan_key]
 
     def populate(self, **kwargs) -> None:
         """Populates the object from dict data."""
@@ -120,17 +159,13 @@ class Model(model.Model):
         """
         self.before_validate(fields)
         errors_map = {}
-        for attr in self.mapper.attrs:
-            if not isinstance(attr, orm.properties.ColumnProperty):
-                continue
-            field = getattr(self.__class__, attr.key)
-            col = self.mapper.columns.get(field.key)
-            if isinstance(col, fmv.ValidateColumn) and (
-                not fields or field.key in fields
-            ):
-                errors = col.validate(self, field.key)
-                if errors:
-                    errors_map[field.key] = errors
+        unique_values = self._unique_values
+        for key, col in self.__class__.get_validate_plan(fields):
+            errors = col.validate(
+                self, key, unique_values.get(key) if unique_values else None
+            )
+            if errors:
+                errors_map[key] = errors
         for field, custom_errors in self.custom_validation(fields).items():
             errors_map[field] = errors_map.get(field, []) + custom_errors
         if errors_map:
@@ -140,6 +175,49 @@ class Model(model.Model):
 
         return True
 
+    @classmethod
+    def validate_many(
+        cls, models: list["Model"], fields: list[str] | None = None
+    ) -> bool:
+        """Validates many objects of the class.
+
+        The values of the unique fields with `check_unique` are searched
+        with one query for each field, instead of one for each object.
+
+        Args:
+            models: Objects to validate.
+            fields: fields that should be validated.
+                If it is None, it will validate all the fields
+        Returns:
+            If the data of all the objects was valid.
+        Raises:
+            ValidateError: For the first object that failed the validation.
+        """
+        unique_values = {}
+        for key, col in cls.get_validate_plan(fields):
+            values = Counter(col.unique_value(obj, key) for obj in models)
+            del values[None]
+            if values:
+                field = getattr(cls, key)
+                used_values = {
+                    value
+                    for value, in cls.query.with_entities(field).filter(
+                        field.in_(values)
+                    )
+                }
+                # A value repeated in the objects is used by the others.
+                unique_values[key] = {
+                    value: count > 1 or value in used_values
+                    for value, count in values.items()
+                }
+        for obj in models:
+            obj._unique_values = unique_values
+            try:
+                obj.validate(fields)
+            finally:
+                del obj._unique_values
+        return True
+
     def history_change(self, field: str) -> "HistoryField":
         """History change of specified field.
 
@@ -192,9 +270,13 @@ class Model(model.Model):
                     "`fields` param in `save' only can be used in update, \
                                   not in new object"
                 )
-            query = self.__class__.query
             fields_to_update = {field: getattr(self, field) for field in fields}
-            query.find(pk=self.pk).update(fields_to_update)
+            self.db.session.execute(
+                update(self.__class__)
+                .where(self.mapper.primary_key[0] == self.pk)
+                .values(**fields_to_update),
+                execution_options={"synchronize_session": False},
+            )
         else:
             self.db.session.add(self)
         if commit:
@@ -234,11 +316,12 @@ class HistoryField:
             model: Model from which to obtain the field.
             field: The field name from which to obtain the history.
         """
-        history = orm.attributes.get_history(model, field)
+        # A new object doesn't have history, so it is not searched.
+        history = None if model.is_new else orm.attributes.get_history(model, field)
         self.history = history
         if (
-            history.unchanged
-            or model.is_new
+            history is None
+            or history.unchanged
             or (not history.deleted and not history.added)
         ):
             self.was_changed = False
@@ -1,12 +1,57 @@
+import functools
 import operator as op
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
 from flask_sqlalchemy import query
-from sqlalchemy import Column
+from sqlalchemy import Column, func, orm, select
 
 __all__ = ["Query"]
 
 
+class ParsedKey(NamedTuple):
+    """Key of `find` parsed for a model class.
+
+    Args:
+        column: Attribute of the model class used in the condition.
+        operator: Function that receives the value and returns the condition.
+        operator_key: Key to search in the relationship.
+        submodel_class: Model class of the relationship, if the
+            column is a relationship.
+        negate: If the condition must be inverted.
+    """
+
+    column: Any
+    operator: Callable[[Any], Any] | None = None
+    operator_key: str = ""
+    submodel_class: Any = None
+    negate: bool = False
+
+
+@functools.lru_cache(maxsize=512)
+def relationship_class(model_class: Any, name: str) -> Any:
+    """Gets the model class of a relationship, the result is cached.
+
+    Args:
+        model_class: The model class that has the relationship.
+        name: Name of the relationship.
+    Returns:
+        The model class of the relationship, None if it is not one.
+    """
+    relationship = model_class.__mapper__.relationships.get(name)
+    return relationship.mapper.class_ if relationship else None
+
+
+def _in(column: Any, value: Any) -> Any:
+    """Condition for the `in` operator."""
+    return column.in_(value if isinstance(value, list) else [value])
+
+
+def _format(method: Callable, pattern: str, value: Any) -> Any:
+    """Condition for the operators in `Query.FORMATS`."""
+    return method(pattern.format(value))
+
+
 class Query(query.Query):
     """override filter to do it dynamic."""
 
@@ -18,15 +63,41 @@ class Query(query.Query):
         "endswith": ("like", "%{}"),
         "iendswith": ("ilike", "%{}"),
     }
+    OPERATORS: dict[str, Callable] = {
+        "ne": op.ne,
+        "ge": op.ge,
+        "gt": op.gt,
+        "lt": op.lt,
+        "le": op.le,
+        "in": _in,
+    }
     NOT = "not_"
 
     def __init__(self, *args, **kwargs):
         """Init object.
 
-        Create a dict for custom joins.
+        Create a dict for custom joins and other for the relationships
+        to load with `autoload`, as the alias of the parent relationship
+        and the relationship attribute.
         """
         super().__init__(*args, **kwargs)
         self._map_joins = {}
+        self._auto_loads = {}
+        self._primary_class_cache = None
+
+    @property
+    def _primary_class(self) -> Any:
+        """Model class of the first entity of the query.
+
+        It is cached with the entity it was taken from, so it is
+        computed again when the entities of the query change.
+        """
+        raw_column = self._raw_columns[0]
+        cached = self._primary_class_cache
+        if cached is None or cached[0] is not raw_column:
+            cached = (raw_column, self._entity_from_pre_ent_zero().class_)
+            self._primary_class_cache = cached
+        return cached[1]
 
     def find(self, *args, **kwargs):
         """Find use operators like others python ORM.
@@ -45,7 +116,30 @@ class Query(query.Query):
         Returns:
             Filter classic query in SQLAlchemy.
         """
-        return self.filter(*self.make_criterion(*args, **kwargs))
+        query = self.filter(*self.make_criterion(*args, **kwargs))
+        auto_loads = self._relationship_loads(kwargs)
+        if auto_loads:
+            query._auto_loads = {**self._auto_loads, **auto_loads}
+        return query
+
+    def _relationship_loads(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Loader options of the relationships searched in `find`.
+
+        Args:
+            kwargs: The kwargs of `find`.
+        Returns:
+            A dict with the name of the relationship and its path.
+        """
+        auto_loads = {}
+        for key, value in kwargs.items():
+            key_string, separator, _ = key.partition("__")
+            if not separator or callable(value) or key_string in self._map_joins:
+                continue
+            parsed_key = self.parse_key(self._primary_class, key)
+            if parsed_key.submodel_class is not None:
+                column = parsed_key.column
+                auto_loads.setdefault(column.key, (None, column))
+        return auto_loads
 
     def cjoin(self, **kwargs: str):
         """Create a join where it's possible to search in `find`.
@@ -120,8 +214,9 @@ class Query(query.Query):
         Returns:
             Join classic query in SQLAlchemy.
         """
-        class_ = self._entity_from_pre_ent_zero().class_
+        class_ = self._primary_class
         query = self
+        auto_loads = dict(self._auto_loads)
         for alias, relationship in kwargs.items():
             model_class = class_
             isouter = False
@@ -129,16 +224,24 @@ class Query(query.Query):
             if relationship.startswith("-"):
                 isouter = True
                 relationship = relationship[1:]
-            if "__" in relationship:
-                model_class, relationship = relationship.split("__")
-                model_class = self._map_joins[model_class]
-            join_class = model_class.__mapper__.relationships.get(
-                relationship
-            ).mapper.class_
+            alias_class, separator, join_relationship = relationship.partition("__")
+            if separator:
+                model_class = self._map_joins[alias_class]
+                relationship = join_relationship
+            join_class = relationship_class(model_class, relationship)
+            if join_class is None:
+                raise AttributeError(
+                    f"`{relationship}` is not a relationship of {model_class}"
+                )
             self._map_joins[alias] = join_class
+            auto_loads[alias] = (
+                alias_class if separator else None,
+                getattr(model_class, relationship),
+            )
             query = query.join(
                 join_class, getattr(model_class, relationship), isouter=isouter
             )
+        query._auto_loads = auto_loads
 
         return query
 
@@ -158,8 +261,9 @@ class Query(query.Query):
         sqlalchemy functions. In that case, it would
         not do anything to that columns.
         """
-        columns = []
-        for column in args:
+        map_joins = self._map_joins
+
+        def to_column(column: Any) -> Any:
             try:
                 # Checks if the column value is a sequence (func, field_name)
                 func, column = column
@@ -167,11 +271,13 @@ class Query(query.Query):
                 # NotImplementedError is for can pass `Foo.id`
                 func = None
             # Doc: Means it comes from a alias used in join:
-            if isinstance(column, str) and "__" in column:
-                model_class, relationship = column.split("__")
-                column = getattr(self._map_joins[model_class], relationship)
-            columns.append(column if not func else func(column))
-        return columns
+            if isinstance(column, str):
+                model_class, separator, relationship = column.partition("__")
+                if separator:
+                    column = getattr(map_joins[model_class], relationship)
+            return column if not func else func(column)
+
+        return [to_column(column) for column in args]
 
     def add_join_columns(self, *args):
         """Add custom columns.
@@ -207,6 +313,58 @@ class Query(query.Query):
         """
         return self.with_entities(*self._args_to_columns(*args))
 
+    def autoload(self):
+        """Load the relationships used in `cjoin` and `find`.
+
+        The relationships of the aliases in `cjoin` and the ones searched
+        in `find` are loaded with `selectinload`, so accessing them in the
+        results does one query for each relationship instead one for each
+        result. It should be called after `cjoin` and `find`.
+
+            Foo.query.cjoin(bar='bar').find(bar__name='foo').autoload().all()
+
+        Returns:
+            Query with the loader options.
+        """
+        loads = {}
+        for alias, (parent, attribute) in self._auto_loads.items():
+            loads[alias] = (
+                loads[parent].selectinload(attribute)
+                if parent
+                else orm.selectinload(attribute)
+            )
+        return self.options(*loads.values())
+
+    def count_fast(self) -> int:
+        """Count the rows without wrapping the query in a subquery.
+
+        It does `SELECT count(*) FROM foo WHERE ...` with the filters of
+        the query. Queries that select something else than one model, or
+        with joins, a custom FROM or statement, distinct, group by, limit
+        or offset need the subquery, for them it uses `count`.
+
+            Foo.query.find(name__contains='bar').count_fast()
+
+        Returns:
+            The number of rows.
+        """
+        if (
+            len(self._raw_columns) != 1
+            or self.column_descriptions[0]["expr"] is not self._primary_class
+            or self._from_obj
+            or self._statement is not None
+            or self._setup_joins
+            or self._distinct
+            or self._group_by_clauses
+            or self._limit_clause is not None
+            or self._offset_clause is not None
+        ):
+            return self.count()
+        statement = select(func.count()).select_from(self._primary_class)
+        if self.whereclause is not None:
+            statement = statement.where(self.whereclause)
+        return self.session.execute(statement).scalar_one()
+
     def make_criterion(self, *args, **kwargs):
         """`Find` use operators like others python ORM.
 
@@ -226,21 +384,32 @@ class Query(query.Query):
         Returns:
             A list of criterions.
         """
-        model_class = self._entity_from_pre_ent_zero().class_
-        criterion = []
-        for expression in args:
-            criterion.append(expression(self))
-        for key, value in kwargs.items():
-            # If value is a func, means that is an expression,
-            # We only add the result of it.
-            condition = (
-                self.get_condition(model_class, key, value)
-                if not callable(value)
-                else value(self)
-            )
-            criterion.append(condition)
+        model_class = self._primary_class
+        get_condition = self.get_condition
+        criterion = [expression(self) for expression in args]
+        # If value is a func, means that is an expression,
+        # We only add the result of it.
+        criterion.extend(
+            get_condition(model_class, key, value)
+            if not callable(value)
+            else value(self)
+            for key, value in kwargs.items()
+        )
         return criterion
 
+    def _make_criterion_single(self, key: str, value: Any) -> Any:
+        """Criterion for a single key of `find`.
+
+        Args:
+            key: Name of the field with the operator.
+            value: Value to field query.
+        Returns:
+            The condition, as `make_criterion(**{key: value})[0]`.
+        """
+        if callable(value):
+            return value(self)
+        return self.get_condition(self._primary_class, key, value)
+
     def get_condition(self, model_class: Any, key: Any, value: Any) -> Any:
         """Get condition for `find` query.
 
@@ -251,38 +420,69 @@ class Query(query.Query):
         Returns:
             A condition to add in filter super()
         """
-        if "__" in key:
-            key_split = key.split("__")
-            key_string = key_split[0]
-            operator_key = "__".join(key_split[1:])
-            # Check if is a field of a join class.
-            if key_string in self._map_joins:
-                return self.get_condition(
-                    self._map_joins[key_string], operator_key, value
+        map_joins = self._map_joins
+        key_string, separator, operator_key = key.partition("__")
+        # Check if is a field of a join class.
+        while separator and key_string in map_joins:
+            model_class = map_joins[key_string]
+            key = operator_key
+            key_string, separator, operator_key = key.partition("__")
+        parsed_key = self.parse_key(model_class, key)
+        if parsed_key.submodel_class is not None:
+            condition = self._get_condition_relationship(
+                parsed_key.column,
+                parsed_key.operator_key,
+                parsed_key.submodel_class,
+                value,
+            )
+        else:
+            condition = parsed_key.operator(value)  # pyright: ignore
+        # Return a invert operator if it started with `not_`
+        return op.invert(condition) if parsed_key.negate else condition
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def parse_key(cls, model_class: Any, key: str) -> "ParsedKey":
+        """Parse a key of `find` for the model class.
+
+        The result is cached, so a key is only parsed once for every
+        model class. The aliases of `cjoin` are not resolved here
+        because they depend of the query.
+
+        Args:
+            model_class: The model class.
+            key: Name of the field with the operator.
+        Returns:
+            The column and the operator to build the condition.
+        """
+        key_string, separator, operator_key = key.partition("__")
+        if separator:
+            if operator_key.startswith(cls.NOT):
+                key = f"{key_string}__{operator_key.removeprefix(cls.NOT)}"
+                parsed_key = cls.parse_key(model_class, key)
+                return parsed_key._replace(negate=not parsed_key.negate)
+            column = getattr(model_class, key_string)
+            operator = cls.OPERATORS.get(operator_key)
+            if operator:
+                return ParsedKey(column, functools.partial(operator, column))
+            if operator_key in cls.FORMATS:
+                method, pattern = cls.FORMATS[operator_key]
+                return ParsedKey(
+                    column,
+                    functools.partial(_format, getattr(column, method), pattern),
                 )
-            # Return a invert operator if starts with `not_``
-            if operator_key.startswith(self.NOT):
-                key = f"{key_string}__{operator_key.split(self.NOT)[1]}"
-                return op.invert(self.get_condition(model_class, key, value))
-            key = getattr(model_class, key_string)
-            if operator_key in ["ne", "ge", "gt", "lt", "le"]:
-                return getattr(op, operator_key)(key, value)
-            if operator_key == "in":
-                return key.in_(value if isinstance(value, list) else [value])
-            if operator_key in self.FORMATS:
-                format_tmp = self.FORMATS[operator_key]
-                return getattr(key, format_tmp[0])(format_tmp[1].format(value))
             if operator_key == "has":
                 key_string = (
                     f"{key_string}" + f"_{model_class.many_to_many_key_relation}"
                 )
-                key = getattr(model_class, key_string)
-            relationship = model_class.__mapper__.relationships.get(key_string)
-            if relationship:
-                return self._get_condition_relationship(
-                    key, operator_key, relationship.mapper.class_, value
+                column = getattr(model_class, key_string)
+            submodel_class = relationship_class(model_class, key_string)
+            if submodel_class is not None:
+                return ParsedKey(
+                    column, operator_key=operator_key, submodel_class=submodel_class
                 )
-        return op.eq(getattr(model_class, key), value)
+        column = getattr(model_class, key)
+        return ParsedKey(column, functools.partial(op.eq, column))
 
     def _get_condition_relationship(
         self, key: Any, operator_key: str, submodel_class: Any, value: Any
@@ -299,7 +499,6 @@ class Query(query.Query):
             Query data.
         """
         query_action = "has"
-        filter_data = {}
         if operator_key == "is_empty":
             return ~key.any() if value else key.any()
         if operator_key == "has":
@@ -307,8 +506,6 @@ class Query(query.Query):
             operator_key = submodel_class.__mapper__.primary_key[0].name
             query_action = "any"
             operator_key += prefix
-        filter_data[operator_key] = value
-        return_data = getattr(key, query_action)(
-            *submodel_class.query.make_criterion(**filter_data)
+        return getattr(key, query_action)(
+            submodel_class.query._make_criterion_single(operator_key, value)
         )
-        return return_data
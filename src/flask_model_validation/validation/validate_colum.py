@@ -1,3 +1,6 @@
+from collections.abc import Callable
+from typing import Any
+
 import sqlalchemy as sa
 
 from .validators import Validator
@@ -5,6 +8,36 @@ from ..models import Model
 
 __all__ = ["ValidateColumn"]
 
+# Flags of the checks that apply to a column.
+CHECK_FOREIGN_KEY = 1
+CHECK_VALIDATORS = 2
+CHECK_NULL = 4
+CHECK_LENGTH = 8
+CHECK_UNIQUE = 16
+
+
+def chain_validators(validators: list[Validator]) -> Callable:
+    """Joins the validators in a single function.
+
+    Args:
+        validators: Validators to apply in order.
+    Returns:
+        A function with the same signature of `Validator.validate`,
+        the value returned by a validator is passed to the next one.
+    """
+    calls = tuple(validator.validate for validator in validators)
+    if len(calls) == 1:
+        return calls[0]
+
+    def validate(value: Any) -> tuple[Any, list[str]]:
+        errors = []
+        for call in calls:
+            value, tmp_errors = call(value)
+            errors.extend(tmp_errors)
+        return value, errors
+
+    return validate
+
 
 class ValidateColumn(sa.Column):
     """Validate column with custom validation before."""
@@ -28,59 +61,121 @@ class ValidateColumn(sa.Column):
         """
         self.validators = validators if validators else []
         self.check_unique = check_unique
+        self._checks: int | None = None
+        self._python_type: type | None = None
+        self._validate_chain: Callable | None = None
         super().__init__(*args, **kwargs)
 
-    def validate(self, model: Model, key: str | None = None) -> list[str]:
+    @property
+    def checks(self) -> int:
+        """Checks that apply to the column, as `CHECK_*` flags.
+
+        They are computed the first time, when the table was already
+        built, because constraints and foreign keys could change
+        the column after it was created.
+        """
+        if self._checks is None:
+            checks = 0
+            if not self.nullable and self.foreign_keys:
+                checks |= CHECK_FOREIGN_KEY
+            if self.validators:
+                checks |= CHECK_VALIDATORS
+                self._validate_chain = chain_validators(self.validators)
+            if not self.nullable and not self.default and not self.primary_key:
+                checks |= CHECK_NULL
+            if getattr(self.type, "length", None):
+                checks |= CHECK_LENGTH
+            if self.unique and self.check_unique:
+                checks |= CHECK_UNIQUE
+            self._checks = checks
+        return self._checks
+
+    @property
+    def python_type(self) -> type:
+        """Python type of the column values, computed the first time."""
+        if self._python_type is None:
+            self._python_type = self.type.python_type
+        return self._python_type
+
+    def unique_value(self, model: Model, key: str) -> Any:
+        """Value of the model that has to be checked as unique.
+
+        Args:
+            model: Model to validate.
+            key: Key used in model for the field.
+        Returns:
+            The value if it has to be searched in database, otherwise None.
+        """
+        value = getattr(model, key)
+        if (
+            value
+            and self.checks & CHECK_UNIQUE
+            and (model.is_new or model.history_change(key).was_changed)
+        ):
+            return value
+        return None
+
+    def validate(
+        self,
+        model: Model,
+        key: str | None = None,
+        unique_values: dict[Any, bool] | None = None,
+    ) -> list[str]:
         """Validate Column.
 
         Args:
             model: Model to validate.
             key: Key used in model for the field, if it not specified,
                 it will take the key self.
+            unique_values: Optional; Values already searched in database,
+                with if they are used. Values not in it are searched.
         Returns:
             A list with the errors if it has,
                 otherwise return empty list.
         """
         if not key:
             key = self.key
+        checks = self.checks
         errors = []
         value = getattr(model, key)
-        if not value and not self.nullable and self.foreign_keys:
+        if not value and checks & CHECK_FOREIGN_KEY:
             for key_obj, relationship in model.mapper.relationships.items():
                 if relationship.local_columns == {self}:
                     if getattr(model, key_obj):
                         value = getattr(model, key_obj).pk
                     break
 
-        for validator in self.validators:
-            value, tmp_errors = validator.validate(value)
-            errors += tmp_errors
-        if (
-            not self.nullable
-            and value is None
-            and not self.default
-            and not self.primary_key
-        ):
+        if checks & CHECK_VALIDATORS:
+            value, tmp_errors = self._validate_chain(value)  # pyright: ignore
+            errors.extend(tmp_errors)
+        if value is None and checks & CHECK_NULL:
             errors.append("Can not be null or empty.")
-        if value and not isinstance(value, self.type.python_type):
+        if value and not isinstance(value, self.python_type):
             errors.append(
-                "Incorrect field type, it must be {}".format(
-                    self.type.python_type.__name__
-                )
+                "Incorrect field type, it must be {}".format(self.python_type.__name__)
             )
         elif (
-            hasattr(self.type, "length")
-            and value
-            and self.type.length  # pyright: ignore[reportGeneralTypeIssues]
+            value
+            and checks & CHECK_LENGTH
             and len(value) > self.type.length  # pyright: ignore
         ):
             errors.append(
                 f"Value exceeeds allowed length ({len(value)}),"
                 f"field has to be {self.type.length} or less"  # type: ignore
             )
-        if value and self.unique and self.check_unique:
+        if value and checks & CHECK_UNIQUE:
             if model.is_new or model.history_change(key).was_changed:
-                if model.__class__.query.filter_by(**{key: value}).first():
+                if unique_values is not None and value in unique_values:
+                    is_used = unique_values[value]
+                else:
+                    column = getattr(model.__class__, key)
+                    is_used = (
+                        model.__class__.query.with_entities(sa.literal(1))
+                        .filter(column == value)
+                        .limit(1)
+                        .scalar()
+                    )
+                if is_used:
                     errors.append("Field has to be unique;" f"{value} is already used.")
         setattr(model, key, value)
         return errors
@@ -3,10 +3,18 @@ from typing import Any
 
 __all__ = ["Validator", "EmailValidator"]
 
+EMAIL_REGEX = re.compile(
+    r'^(([^<>()[\]\\.,;:\s@"]+(\.[^<>()[\]\\.,;:\s@"]+)*)|(".+"))'
+    + r"@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\])"
+    + r"|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$"
+)
+
 
 class Validator:
     """Validator fo ValidateColumn class."""
 
+    __slots__ = ("errors",)
+
     def __init__(self):
         """Init the object."""
         self.errors: list[str] = []
@@ -27,19 +35,16 @@ class Validator:
 class EmailValidator(Validator):
     """Validator for email."""
 
+    __slots__ = ("regex", "pattern")
+
     def __init__(self, regex: str | None = None):
         """Init the object.
 
         Args:
             regex(str): Regex to validate the email value.
         """
-        self.regex = regex
-        if not self.regex:
-            self.regex = (
-                r'^(([^<>()[\]\\.,;:\s@"]+(\.[^<>()[\]\\.,;:\s@"]+)*)|(".+"))'
-                + r"@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\])"
-                + r"|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$"
-            )
+        self.regex = regex if regex else EMAIL_REGEX.pattern
+        self.pattern = re.compile(regex) if regex else EMAIL_REGEX
         super().__init__()
 
     def validate(self, value: str | None) -> tuple[str | None, list[str]]:
@@ -53,12 +58,7 @@ class EmailValidator(Validator):
                 otherwise return a empty list.
         """
         errors = []
-        if not isinstance(value, str) or (
-            value
-            and not re.search(
-                self.regex, value  # pyright: ignore[reportGeneralTypeIssues]
-            )
-        ):
+        if not isinstance(value, str) or (value and not self.pattern.search(value)):
             errors.append(f"{value} is not a valid email")
         return value, errors
 
@@ -66,6 +66,8 @@ class EmailValidator(Validator):
 class RequiredValidator(Validator):
     """Validator for required."""
 
+    __slots__ = ("allow_empty", "allow_null")
+
     def __init__(self, allow_empty: bool = False, allow_null: bool = False):
         """Init the object.
 
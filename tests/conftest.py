@@ -25,6 +25,10 @@ def app_ctx(app: Flask) -> Generator[AppContext, None, None]:
 @pytest.fixture
 def db(app: Flask) -> SQLAlchemyModelValidation:
     """Creates and returns the database model for tests."""
-    db = SQLAlchemyModelValidation()
+    # A new instance for every test, the extension is a singleton.
+    SQLAlchemyModelValidation.instance = None
+    db = SQLAlchemyModelValidation(
+        session_options={"autoflush": False, "expire_on_commit": False}
+    )
     db.init_app(app)
     return db
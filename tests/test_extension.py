@@ -0,0 +1,19 @@
+from flask import Flask
+
+from flask_model_validation import SQLAlchemyModelValidation
+from flask_model_validation import extension
+
+
+def test_singleton(app: Flask):
+    """GIVEN the extension is created with the app
+    WHEN it is created again or got through `db`
+    THEN the same instance should be returned, still registered in the app.
+    """
+    SQLAlchemyModelValidation.instance = None
+    db = SQLAlchemyModelValidation(app)
+    assert SQLAlchemyModelValidation() is db
+    assert extension.db() is db
+    # Creating it again doesn't unregister the app.
+    with app.app_context():
+        with db.engine.connect() as connection:
+            assert connection.execute(db.text("select 1")).scalar() == 1
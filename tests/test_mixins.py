@@ -1,4 +1,8 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
 
 from flask_model_validation import SQLAlchemyModelValidation
 from flask_model_validation.models import mixins
@@ -42,7 +46,28 @@ def test_timpestamp_mixin(db: SQLAlchemyModelValidation):
     user.save(commit=True)
     assert created_time == user.created
     assert user.updated is not None
-    assert user.updated > user.created
+    # The database sets the timestamps, SQLite resolution is in seconds.
+    assert user.updated >= user.created
+    # The timestamps are in UTC.
+    utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
+    assert abs(utc_now - user.created) < timedelta(minutes=1)
+    assert (
+        str(mixins.UtcNow().compile(dialect=postgresql.dialect()))
+        == "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+    )
+
+    # Tables created without a database default for `created_at` still work.
+    class Item(db.Model, mixins.IdMixin, mixins.TimestampMixin):
+        pass
+
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE item (id INTEGER PRIMARY KEY, "
+            "created_at DATETIME NOT NULL, updated_at DATETIME)"
+        )
+    item = Item()
+    item.save(commit=True)
+    assert item.created is not None
 
 
 @pytest.mark.usefixtures("app_ctx")
@@ -72,6 +97,29 @@ def test_slug_mixin(db: SQLAlchemyModelValidation):
     status_2 = Status(name="On Stock")
     status_2.save(commit=True)
     assert status_2.slug == "on-sto-2"
+    # A word longer than the slug is cut.
+    status_3 = Status(name="Overstocked")
+    status_3.save(commit=True)
+    assert status_3.slug == "overstoc"
+    # Rows that are not flushed yet also reserve their slug.
+    status_4 = Status(name="In Transit")
+    status_4.save()
+    status_5 = Status(name="In Transit")
+    status_5.save()
+    assert status_4.slug == "in"
+    assert status_5.slug == "in-1"
+    # A pending row that gets a new slug frees the old one.
+    status_4.name = "Out"
+    status_4.generate_slug()
+    status_6 = Status(name="In Transit")
+    status_6.save()
+    assert status_4.slug == "out"
+    assert status_6.slug == "in"
+    # The other pending slugs are still reserved.
+    status_7 = Status(name="In Transit")
+    status_7.save()
+    assert status_7.slug == "in-2"
+    db.session.commit()
 
 
 @pytest.mark.usefixtures("app_ctx")
@@ -108,17 +156,43 @@ def test_define_catalog_mixin(db: SQLAlchemyModelValidation):
             SOLD_OUT = "sold-out"
             REQUESTED = "requested"
             NOT_ADDED_TO_DATABASE = "not-added-to-database"
+            cache = "cache"
 
     db.create_all()
-    for name in ["On Stock", "Sold Out", "Requested"]:
+    for name in ["Sold Out", "Requested", "Cache"]:
         status = Status(name=name)
         status.save(commit=True)
 
-    on_stock = Status.catalog().ON_STOCK
-    assert on_stock.name == "On Stock"
+    # Reading the catalog doesn't touch the rows of the session.
+    requested = Status.query.find(slug="requested").first()
+    requested.name = "Requested Now"
+    # The rows flushed in the transaction are found.
+    on_stock = Status(name="On Stock")
+    on_stock.save(flush=True)
+    assert Status.catalog().ON_STOCK is on_stock
+    # The rows loaded by the catalog are not left in the session.
+    assert Status.catalog().SOLD_OUT not in db.session
+    db.session.commit()
+    assert Status.query.find(name="Requested Now").count() == 1
+    # All the elements of the catalog were fetched with the first one.
+    statements = []
+
+    def add_statement(*args):
+        statements.append(args)
+
+    event.listen(db.engine, "before_cursor_execute", add_statement)
+    try:
+        assert Status.catalog().SOLD_OUT.slug == "sold-out"
+        assert Status.catalog().key("requested").slug == "requested"
+    finally:
+        event.remove(db.engine, "before_cursor_execute", add_statement)
+    assert statements == []
     # It will be the same memory direction if it was saved in cache.
     assert id(on_stock) == id(Status.catalog().ON_STOCK)
     assert Status.catalog().SOLD_OUT.name == "Sold Out"
+    # The names used by the catalog object are not replaced.
+    assert isinstance(Status.catalog().cache, dict)
+    assert Status.catalog().key("cache").name == "Cache"
     with pytest.raises(AttributeError):
         Status.catalog().NOT_IN_CATALOG
     # This element was added into the catalog but not into database.
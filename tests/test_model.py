@@ -17,8 +17,6 @@ def test_model_functions(db: SQLAlchemyModelValidation):
         name = db.ValidateColumn("changing_name", db.String)
 
     db.create_all()
-    # Set to False the `autoflush` to test the save options.
-    db.session.autoflush = False
     user = User(name="test")
     assert user.pk is None
     assert user.force_pk is not None
@@ -42,8 +40,6 @@ def test_save_model(db: SQLAlchemyModelValidation):
         )
 
     db.create_all()
-    # Set to False the `autoflush` to test the save options.
-    db.session.autoflush = False
     user = User(name="test")
 
     # User is added to the session but not flushed or commited
@@ -60,7 +56,7 @@ def test_save_model(db: SQLAlchemyModelValidation):
     assert User.query.find(name="test").first() is None
     # User should persist because it was commited.
     user.save(commit=True)
-    assert user == User.query.find(name="test").first()
+    assert user == db.session.get(User, user.pk)
     db.session.rollback()
     assert user == User.query.find(name="test").first()
     user = User(name="test")
@@ -76,6 +72,46 @@ def test_save_model(db: SQLAlchemyModelValidation):
     user.name = "test 3"
     user.save(fields=["name"], commit=True)
     assert user == User.query.find(name="test 3").first()
+    # Without autoflush, only the update statement changes the database.
+    user.name = "test 4"
+    user.save(fields=["name"])
+    assert User.query.with_entities(User.name).find(id=user.id).scalar() == "test 4"
+    # With autoflush the pending changes are flushed before a query.
+    db.session.autoflush = True
+    user = User(name="test 5")
+    user.save()
+    assert user == User.query.find(name="test 5").first()
+
+
+@pytest.mark.usefixtures("app_ctx")
+def test_validate_many(db: SQLAlchemyModelValidation):
+    """GIVEN many users will be validated together
+    WHEN `User` models are created with a `check_unique` field
+    THEN the users are validated with `validate_many`.
+    """
+
+    class User(db.Model):
+        id = db.ValidateColumn(db.Integer, primary_key=True)
+        name = db.ValidateColumn(db.String, unique=True, check_unique=True)
+
+        def validate(self, fields: list[str] | None = None) -> bool:
+            # Overridden with the public signature.
+            return super().validate(fields)
+
+    db.create_all()
+    User(name="test").save(commit=True)
+    users = [User(name="test 2"), User(name="test 3"), User()]
+    assert User.validate_many(users)
+    # The name already in database fails for its own object.
+    users.append(User(name="test"))
+    with pytest.raises(ex.ValidateError) as error:
+        User.validate_many(users)
+    assert "name" in error.value.errors
+    assert User.validate_many(users[:-1], fields=["name"])
+    # The same value twice can't be saved.
+    with pytest.raises(ex.ValidateError) as error:
+        User.validate_many([User(name="test 4"), User(name="test 4")])
+    assert "name" in error.value.errors
 
 
 @pytest.mark.usefixtures("app_ctx")
@@ -99,7 +135,9 @@ def test_validate_model(db: SQLAlchemyModelValidation):
         user.save()
     # name should be added and email is not a valid email.
     assert error.value.model_class == User
-    assert all([attr in error.value.errors for attr in ["name", "email"]])
+    assert {"name", "email"} <= error.value.errors.keys()
+    # Every field error is in its own line.
+    assert len(str(error.value).splitlines()) == 3
     # Using populate to change the data to a not valid length data.
     user.populate(name="TestTheLength", email="test@test.com")
     assert user.validate(fields=["email"])
@@ -148,8 +186,6 @@ def test_validate_lifecycle(db: SQLAlchemyModelValidation):
             pass
 
     db.create_all()
-    # Set to False the `autoflush` to test the save options.
-    db.session.autoflush = False
     user = User(email="3")
     # new User should rase a ValidateError for the email validator
     with pytest.raises(ex.ValidateError) as error:
@@ -182,8 +218,6 @@ def test_delete_model(db: SQLAlchemyModelValidation):
             self.deleted = True
 
     db.create_all()
-    # Set to False the `autoflush` to test the save options.
-    db.session.autoflush = False
     user = User()
     user.save(commit=True)
     assert User.query.find().first() is not None
@@ -204,15 +238,14 @@ def test_history_field(db: SQLAlchemyModelValidation):
         name = db.ValidateColumn(db.String(24))
 
     db.create_all()
-    # Set to False the `autoflush` to test the save options.
-    db.session.autoflush = False
     user = User(name="Test")
     h = user.history_change("name")
+    assert h.history is None
     assert not h.was_changed
     assert h.previous_value is None
     assert h.current_value is None
     user.save(commit=True)
-    user_from_db = User.query.find(name="Test").first()
+    user_from_db = db.session.get(User, user.pk)
     h = user_from_db.history_change("name")
     assert not h.was_changed
     assert h.previous_value is None
@@ -1,15 +1,41 @@
+from collections.abc import Generator
 from typing import Any
 
 import pytest
 from flask import Flask
-from sqlalchemy import event
+from sqlalchemy import event, func, inspect
 
 from flask_model_validation import SQLAlchemyModelValidation
 from flask_model_validation.models import mixins
 from flask_model_validation.expressions import and_, or_, _
 
 
-@pytest.fixture
+def case_sensitive_like(dbapi_connection: Any, _: Any) -> None:
+    """Sets the database case sensitive."""
+    dbapi_connection.execute("pragma case_sensitive_like=ON")
+
+
+@pytest.fixture(scope="module")
+def app() -> Flask:
+    """Creates the Flask app once for the module, the data is only read."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    return app
+
+
+@pytest.fixture(scope="module")
+def db(app: Flask) -> SQLAlchemyModelValidation:
+    """Creates the database model once for the module."""
+    # A new instance for the module, the extension is a singleton.
+    SQLAlchemyModelValidation.instance = None
+    db = SQLAlchemyModelValidation(
+        session_options={"autoflush": False, "expire_on_commit": False}
+    )
+    db.init_app(app)
+    return db
+
+
+@pytest.fixture(scope="module")
 def User(db: SQLAlchemyModelValidation, UserTeam) -> Any:
     """Creates the User model."""
 
@@ -31,7 +57,7 @@ def User(db: SQLAlchemyModelValidation, UserTeam) -> Any:
     return User
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def Company(db: SQLAlchemyModelValidation) -> Any:
     """Creates the Company model."""
 
@@ -44,7 +70,7 @@ def Company(db: SQLAlchemyModelValidation) -> Any:
     return Company
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def Team(db: SQLAlchemyModelValidation) -> Any:
     """Creates the Team model."""
 
@@ -60,7 +86,7 @@ def Team(db: SQLAlchemyModelValidation) -> Any:
     return Team
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def UserTeam(db: SQLAlchemyModelValidation) -> Any:
     """Creates the UserTeam model."""
 
@@ -77,18 +103,18 @@ def UserTeam(db: SQLAlchemyModelValidation) -> Any:
     return UserTeam
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def create_all(
     app: Flask, db: SQLAlchemyModelValidation, User, Company, Team, UserTeam
 ):
-    """Using the app context, create the models and populate the db."""
+    """Using the app context, create the models and populate the db.
+
+    It is done once for the module, what a test does not commit is
+    discarded when its app context ends.
+    """
     with app.app_context():
-        # Sets the database case sensitive.
-        event.listen(
-            db.engine,
-            "connect",
-            lambda db, _: db.execute("pragma case_sensitive_like=ON"),
-        )
+        if not event.contains(db.engine, "connect", case_sensitive_like):
+            event.listen(db.engine, "connect", case_sensitive_like)
         db.create_all()
         companies = [
             {"name": "Company One"},
@@ -106,88 +132,125 @@ def create_all(
             {"name": "Team Three"},
         ]
 
-        for idx in range(3):
-            company = Company(**companies[idx])
-            company.save(flush=True)
-            team = Team(**teams[idx], company=company)
-            team.save(flush=True)
-            user = User(company_id=company.id, **users[idx])
-            user.save(commit=True)
+        # The ids are known, the first user is in all the teams.
+        db.session.bulk_save_objects(
+            [Company(**company) for company in companies]
+            + [Team(**team, company_id=idx + 1) for idx, team in enumerate(teams)]
+            + [User(**user, company_id=idx + 1) for idx, user in enumerate(users)]
+            + [UserTeam(user_id=1, team_id=idx + 1) for idx in range(len(teams))]
+            + [User(name="Other"), Company(name="Without employees")]
+        )
+        db.session.commit()
+
 
-        for team in Team.query.all():
-            user = User.query.first()
-            ut = UserTeam(user=user, team=team)
-            ut.save(commit=True)
+@pytest.fixture
+def statements(db: SQLAlchemyModelValidation) -> Generator[list, None, None]:
+    """Statements executed in the database while the test runs."""
+    statements = []
 
-        user = User(name="Other")
-        user.save(commit=True)
+    def add_statement(*args):
+        statements.append(args)
 
-        company = Company(name="Without employees")
-        company.save(commit=True)
+    event.listen(db.engine, "before_cursor_execute", add_statement)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", add_statement)
 
 
 @pytest.mark.usefixtures("app_ctx")
-def test_string_query(User):
+@pytest.mark.parametrize(
+    "kwargs, count",
+    [
+        ({"name": "User One"}, 1),
+        ({"name__ne": "User One"}, 3),
+        ({"name__startswith": "user"}, 0),
+        ({"name__istartswith": "user"}, 3),
+        ({"name__not_istartswith": "user"}, 1),
+        ({"name__endswith": "one"}, 0),
+        ({"name__iendswith": "one"}, 1),
+        ({"name__not_iendswith": "one"}, 3),
+        ({"name__contains": "one"}, 0),
+        ({"name__icontains": "one"}, 2),
+        ({"company__name": "Company One"}, 1),
+        ({"company__name__ne": "Company One"}, 2),
+        ({"teams__is_empty": True}, 3),
+        ({"teams__is_empty": False}, 1),
+        ({"teams__has": [1]}, 1),
+        ({"teams__not_has": [1]}, 3),
+    ],
+)
+def test_string_query(User, kwargs: dict[str, Any], count: int):
     """GIVEN The user want to do a query with strings
     WHEN the models have been created
     THEN the query should be return right data.
     """
-    assert User.query.find(name="User One").count() == 1
-    assert User.query.find(name__ne="User One").count() == 3
-    assert User.query.find(name__startswith="user").count() == 0
-    assert User.query.find(name__istartswith="user").count() == 3
-    assert User.query.find(name__not_istartswith="user").count() == 1
-    assert User.query.find(name__endswith="one").count() == 0
-    assert User.query.find(name__iendswith="one").count() == 1
-    assert User.query.find(name__not_iendswith="one").count() == 3
-    assert User.query.find(name__contains="one").count() == 0
-    assert User.query.find(name__icontains="one").count() == 2
-    assert User.query.find(company__name="Company One").count() == 1
-    assert User.query.find(company__name__ne="Company One").count() == 2
-    assert User.query.find(teams__is_empty=True).count() == 3
-    assert User.query.find(teams__is_empty=False).count() == 1
-    assert User.query.find(teams__has=[1]).count() == 1
-    assert User.query.find(teams__not_has=[1]).count() == 3
+    assert User.query.find(**kwargs).count_fast() == count
+
+
+@pytest.mark.usefixtures("app_ctx")
+def test_parse_key(User, Company):
+    """GIVEN The user want to know how a key of `find` is parsed
+    WHEN the models have been created
+    THEN the key should be parsed to its column and operator.
+    """
+    parsed_key = User.query.parse_key(User, "name__not_in")
+    assert parsed_key.column is User.name
+    assert parsed_key.negate
+    assert not User.query.parse_key(User, "name__not_not_in").negate
+    parsed_key = User.query.parse_key(User, "company__name__ne")
+    assert parsed_key.column is User.company
+    assert parsed_key.submodel_class is Company
+    assert parsed_key.operator_key == "name__ne"
+    assert User.query.parse_key(User, "teams__has").column is User.teams_has
+    # A key that is not a field, an operator or a relationship.
+    with pytest.raises(AttributeError):
+        User.query.parse_key(User, "name__unknown")
 
 
 @pytest.mark.usefixtures("app_ctx")
-def test_int_query(User):
+@pytest.mark.parametrize(
+    "kwargs, count",
+    [
+        ({"age": 18}, 1),
+        ({"age": None}, 1),
+        ({"age__ne": 18}, 2),
+        ({"age__gt": 18}, 2),
+        ({"age__ge": 18}, 3),
+        ({"age__not_ge": 29}, 2),
+        ({"age__lt": 29}, 2),
+        ({"age__le": 29}, 3),
+        ({"age__in": [18, 25]}, 2),
+        ({"age__not_in": [18, 25]}, 1),
+    ],
+)
+def test_int_query(User, kwargs: dict[str, Any], count: int):
     """GIVEN The user want to do a query with integers
     WHEN the models have been created
     THEN the query should be return right data.
     """
-    assert User.query.find(age=18).count() == 1
-    assert User.query.find(age=None).count() == 1
-    assert User.query.find(age__ne=18).count() == 2
-    assert User.query.find(age__gt=18).count() == 2
-    assert User.query.find(age__ge=18).count() == 3
-    assert User.query.find(age__not_ge=29).count() == 2
-    assert User.query.find(age__lt=29).count() == 2
-    assert User.query.find(age__le=29).count() == 3
-    assert User.query.find(age__in=[18, 25]).count() == 2
-    assert User.query.find(age__not_in=[18, 25]).count() == 1
+    assert User.query.find(**kwargs).count_fast() == count
 
 
 @pytest.mark.usefixtures("app_ctx")
-def test_expressions_query(User):
+@pytest.mark.parametrize(
+    "expression, count",
+    [
+        (or_(name="User One", age=29), 2),
+        (or_(_(name="User One"), _(name="User Two")), 2),
+        (and_(name="User One", age=29), 0),
+        (and_(name="User One", age=18), 1),
+        (or_(and_(name="User One", age=18), and_(name="User Two", age=25)), 2),
+    ],
+)
+def test_expressions_query(User, expression: Any, count: int):
     """GIVEN The user want to do a query with expressions
     WHEN the models have been created
     THEN the query should be return right data.
     """
-    assert User.query.find(or_(name="User One", age=29)).count() == 2
-    assert User.query.find(or_(_(name="User One"), _(name="User Two"))).count() == 2
-    assert User.query.find(and_(name="User One", age=29)).count() == 0
-    assert User.query.find(and_(name="User One", age=18)).count() == 1
-    assert (
-        User.query.find(
-            or_(and_(name="User One", age=18), and_(name="User Two", age=25))
-        ).count()
-        == 2
-    )
+    assert User.query.find(expression).count_fast() == count
 
 
 @pytest.mark.usefixtures("app_ctx")
-def test_join_query(User):
+def test_join_query(db: SQLAlchemyModelValidation, User, Company):
     """GIVEN The user want to do a query with joins
     WHEN the models have been created
     THEN the query should be return right data.
@@ -202,3 +265,46 @@ def test_join_query(User):
     assert User.query.cjoin(company="company").find().count() == 3
     # Left Join
     assert User.query.cjoin(company="-company").find().count() == 4
+    # Joins are counted with the subquery.
+    assert User.query.cjoin(company="company").find().count_fast() == 3
+    # As the queries of many entities or columns.
+    assert db.session.query(User, Company).count_fast() == 16
+    assert User.query.with_entities(func.count(User.id)).count_fast() == 1
+    # Columns of the aliases.
+    assert User.query.cjoin(company="company").join_entities(
+        User.name, "company__name"
+    ).find(name="User Two").one() == ("User Two", "Company Two")
+    assert (
+        User.query.cjoin(company="company")
+        .add_join_columns((func.count, "company__id"))
+        .one()[1]
+        == 3
+    )
+
+
+@pytest.mark.usefixtures("app_ctx")
+def test_autoload_query(db: SQLAlchemyModelValidation, User, statements: list):
+    """GIVEN The user want to access the relationships used in the query
+    WHEN the query is done with `autoload`
+    THEN the relationships should be loaded with the results.
+    """
+    users = (
+        User.query.cjoin(teamuser="teams", team="teamuser__team")
+        .find(company__name__ne="Company Two")
+        .autoload()
+        .all()
+    )
+    statements.clear()
+    assert [team.team.name for user in users for team in user.teams] == [
+        "Team One",
+        "Team Two",
+        "Team Three",
+    ]
+    assert {user.company.name for user in users} == {"Company One"}
+    assert statements == []
+    # The relationships searched in a derived query are not loaded by the base.
+    db.session.expunge_all()
+    base = User.query.find()
+    base.find(company__name="Company One")
+    users = base.autoload().all()
+    assert all("company" in inspect(user).unloaded for user in users)
@@ -3,6 +3,7 @@ import pytest
 import flask_model_validation.exceptions as ex
 from flask_model_validation import SQLAlchemyModelValidation
 from flask_model_validation.validation import validators
+from flask_model_validation.validation.validate_colum import chain_validators
 
 
 def test_email_validator():
@@ -58,3 +59,22 @@ def test_custom_validator(db: SQLAlchemyModelValidation):
         str(error.value)
         == f"{ex.MESSAGE_ERROR}\nage: {['Value should be less than 10']}"
     )
+
+
+def test_chain_validators():
+    """GIVEN many validators are used in a column
+    WHEN they are chained
+    THEN all of them should be applied in order
+    """
+
+    class StripValidator(validators.Validator):
+        def validate(self, value):
+            return value.strip(), []
+
+    validate = chain_validators(
+        [StripValidator(), validators.RequiredValidator(), validators.EmailValidator()]
+    )
+    assert validate(" test@test.com ") == ("test@test.com", [])
+    assert validate("  ") == ("", ["Value can not be empty"])
+    _, errors = validate(" test ")
+    assert errors == ["test is not a valid email"]